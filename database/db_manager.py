@@ -1,7 +1,12 @@
+import functools
 import logging
+import threading
 from contextlib import contextmanager
-from typing import Any
-import psycopg2
+from typing import Any, Iterator
+import psycopg
+from psycopg.rows import dict_row
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
 import os
 from dotenv import load_dotenv
 
@@ -9,9 +14,213 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Executions of the same statement before psycopg prepares it server-side.
+# Prepared statements are cached per connection, so pooled connections keep
+# reusing the insert plans across batches.
+PREPARE_THRESHOLD = 1
+
+# Rows fetched per round-trip when streaming from server-side cursors
+FETCH_SIZE = 2000
+
+# Bounds for the shared connection pool
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = 20
+
+# Column order used when building positional rows for bulk inserts. The
+# reports geometry is built from (longitude, latitude) by the VALUES template.
+REPORT_COLUMNS = (
+    "report_id",
+    "report_url",
+    "report_type",
+    "observation_date",
+    "location_name",
+    "region_id",
+    "sub_region_name",
+    "geom",
+    "elevation_ft",
+    "aspect",
+    "slope_angle",
+)
+OBSERVATION_COLUMNS = (
+    "report_id",
+    "red_flags",
+    "new_snow_depth",
+    "new_snow_density",
+    "snow_surface_conditions",
+    "avy_problem_1",
+    "avy_problem_1_trend",
+    "avy_problem_2",
+    "avy_problem_2_trend",
+    "today_rating",
+    "tomorrow_rating",
+)
+AVALANCHE_COLUMNS = (
+    "report_id",
+    "avalanche_date",
+    "trigger",
+    "trigger_additional",
+    "avalanche_type",
+    "problem",
+    "weak_layer",
+    "depth",
+    "width_feet",
+    "vertical_feet",
+    "caught",
+    "carried",
+)
+
+# Multi-row inserts binding one array per column. The array types must match
+# the positional rows built by _partition_reports.
+INSERT_REPORTS_SQL = """
+    INSERT INTO reports (
+        report_id, report_url, report_type, observation_date,
+        location_name, region_id, sub_region_name, geom,
+        elevation_ft, aspect, slope_angle
+    )
+    SELECT
+        report_id, report_url, report_type, observation_date,
+        location_name, region_id, sub_region_name,
+        ST_SetSRID(ST_MakePoint(longitude, latitude), 4326),
+        elevation_ft, aspect, slope_angle
+    FROM UNNEST(
+        %s::text[], %s::text[], %s::text[], %s::date[],
+        %s::text[], %s::int[], %s::text[], %s::float8[],
+        %s::float8[], %s::int[], %s::text[], %s::int[]
+    ) AS t(
+        report_id, report_url, report_type, observation_date,
+        location_name, region_id, sub_region_name, longitude,
+        latitude, elevation_ft, aspect, slope_angle
+    )
+    ON CONFLICT (report_id) DO NOTHING
+"""
+INSERT_AVALANCHES_SQL = f"""
+    INSERT INTO avalanches ({", ".join(AVALANCHE_COLUMNS)})
+    SELECT * FROM UNNEST(
+        %s::text[], %s::date[], %s::text[], %s::text[],
+        %s::text[], %s::text[], %s::text[], %s::int[],
+        %s::int[], %s::int[], %s::int[], %s::int[]
+    )
+    ON CONFLICT (report_id) DO NOTHING
+"""
+
+
+def _transpose(rows: list[tuple]) -> list[list]:
+    """Turn positional rows into one list per column, for UNNEST binding."""
+    return [list(column) for column in zip(*rows)]
+
+
+def _to_float(value: Any) -> float | None:
+    """Coerce a numeric value (possibly a string) to float, keeping None."""
+    return None if value is None else float(value)
+
+
+def _to_int(value: Any) -> int | None:
+    """Coerce a numeric value (possibly a string) to int, keeping None."""
+    return None if value is None else round(float(value))
+
+
+def _report_type(base_info: dict[str, Any]) -> str:
+    """Determine the report type from the report URL."""
+    return "avalanche" if "/avalanche/" in base_info["report_url"] else "observation"
+
+
+def _partition_reports(
+    reports: list[tuple[dict, dict, str]],
+) -> tuple[list[tuple], list[tuple], list[tuple]]:
+    """Split typed reports into positional rows for each table.
+
+    Report rows carry longitude and latitude as two separate values in place
+    of ``geom``; callers decide how to turn them into a geometry.
+    """
+    report_rows = [
+        (
+            base_info["report_id"],
+            base_info["report_url"],
+            report_type,
+            base_info["observation_date"],
+            base_info["location_name"],
+            base_info["region_id"],
+            base_info["sub_region_name"],
+            # Bind numbers as numbers so the server never parses them, and so
+            # every value in an UNNEST array column has the same type
+            _to_float(base_info["longitude"]),
+            _to_float(base_info["latitude"]),
+            _to_int(base_info["elevation_ft"]),
+            base_info["aspect"],
+            _to_int(base_info["slope_angle"]),
+        )
+        for base_info, _, report_type in reports
+    ]
+    observation_rows = [
+        tuple(data[column] for column in OBSERVATION_COLUMNS)
+        for _, data, report_type in reports
+        if report_type == "observation"
+    ]
+    avalanche_rows = [
+        tuple(data[column] for column in AVALANCHE_COLUMNS)
+        for _, data, report_type in reports
+        if report_type == "avalanche"
+    ]
+    return report_rows, observation_rows, avalanche_rows
+
+
+def _point_ewkt(longitude: float | None, latitude: float | None) -> str | None:
+    """Format a WGS84 point as EWKT, or None if either coordinate is missing."""
+    if longitude is None or latitude is None:
+        return None
+    return f"SRID=4326;POINT({longitude} {latitude})"
+
+
+def _copy_batches(
+    reports: list[tuple[dict, dict]],
+) -> list[tuple[str, tuple[str, ...], list[tuple]]]:
+    """Build the non-empty (table, columns, rows) batches for a COPY load."""
+    typed_reports = [
+        (base_info, specific_data, _report_type(base_info))
+        for base_info, specific_data in reports
+    ]
+    report_rows, observation_rows, avalanche_rows = _partition_reports(typed_reports)
+    # COPY cannot evaluate ST_MakePoint, so send the point as EWKT text
+    report_rows = [
+        row[:7] + (_point_ewkt(row[7], row[8]),) + row[9:] for row in report_rows
+    ]
+    return [
+        (table, columns, rows)
+        for table, columns, rows in (
+            ("reports", REPORT_COLUMNS, report_rows),
+            ("observations", OBSERVATION_COLUMNS, observation_rows),
+            ("avalanches", AVALANCHE_COLUMNS, avalanche_rows),
+        )
+        if rows
+    ]
+
+
+def _copy_statements(table: str, columns: tuple[str, ...]) -> tuple[str, str, str]:
+    """SQL to create a staging table, COPY into it, and upsert from it."""
+    column_list = ", ".join(columns)
+    return (
+        f"""
+        CREATE TEMP TABLE {table}_staging
+        (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP
+        """,
+        f"COPY {table}_staging ({column_list}) FROM STDIN WITH (FORMAT text)",
+        f"""
+        INSERT INTO {table} ({column_list})
+        SELECT {column_list} FROM {table}_staging
+        ON CONFLICT (report_id) DO NOTHING
+        """,
+    )
+
 
 class DatabaseManager:
-    """Manages PostgreSQL/PostGIS database connections and operations."""
+    """Manages PostgreSQL/PostGIS database connections and operations.
+
+    Connections are drawn from a pool shared by every manager that targets the
+    same database, so repeated calls skip the connect/auth handshake.
+    """
+
+    _pools: dict[str, ConnectionPool] = {}
+    _pools_lock = threading.Lock()
 
     def __init__(
         self,
@@ -33,37 +242,60 @@ class DatabaseManager:
         self.conn_params = {
             "host": host,
             "port": port,
-            "database": database,
+            "dbname": database,
             "user": user,
             "password": password,
         }
         logger.info(f"Database manager initialized for {host}:{port}/{database}")
 
+    @property
+    def _pool(self) -> ConnectionPool:
+        """Connection pool for these parameters, created on first use."""
+        conninfo = make_conninfo("", **self.conn_params)
+        with self._pools_lock:
+            pool = self._pools.get(conninfo)
+            if pool is None:
+                pool = ConnectionPool(
+                    conninfo,
+                    min_size=POOL_MIN_SIZE,
+                    max_size=POOL_MAX_SIZE,
+                    kwargs={"prepare_threshold": PREPARE_THRESHOLD},
+                    open=True,
+                )
+                self._pools[conninfo] = pool
+                logger.info(f"Opened connection pool (max {POOL_MAX_SIZE})")
+        return pool
+
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections.
+        """Context manager for pooled database connections.
+
+        The connection is returned to the pool on exit instead of being closed.
 
         Yields:
-            psycopg2.connection: Active database connection
+            psycopg.Connection: Active database connection
 
         Example:
             with db.get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute("SELECT * FROM reports")
         """
-        conn = None
+        pool = self._pool
+        conn = pool.getconn()
         try:
-            conn = psycopg2.connect(**self.conn_params)
             yield conn
             conn.commit()
         except Exception as e:
-            if conn:
-                conn.rollback()
+            conn.rollback()
             logger.error(f"Database error: {e}")
             raise
+        except BaseException:
+            # e.g. GeneratorExit when a streaming caller stops early; never hand
+            # the pool a connection that is still inside a transaction
+            conn.rollback()
+            raise
         finally:
-            if conn:
-                conn.close()
+            pool.putconn(conn)
 
     def insert_report(
         self,
@@ -79,111 +311,163 @@ class DatabaseManager:
             report_type: Either 'observation' or 'avalanche'
         """
         print(f"Inserting {report_type} report: {base_info['report_id']}")
+        self._insert_reports([(base_info, specific_data, report_type)])
 
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                # Insert base report
-                cur.execute(
-                    """
-                    INSERT INTO reports (
-                        report_id, report_url, report_type, observation_date,
-                        location_name, region_id, sub_region_name, geom,
-                        elevation_ft, aspect, slope_angle
-                    ) VALUES (
-                        %(report_id)s, %(report_url)s, %(report_type)s, %(observation_date)s,
-                        %(location_name)s, %(region_id)s, %(sub_region_name)s,
-                        ST_SetSRID(ST_MakePoint(%(longitude)s, %(latitude)s), 4326),
-                        %(elevation_ft)s, %(aspect)s, %(slope_angle)s
-                    )
-                    ON CONFLICT (report_id) DO NOTHING
-                    """,
-                    {
-                        **base_info,
-                        "report_type": report_type,
-                        "sub_region_name": base_info.get("sub-region_name"),
-                    },
-                )
+    def insert_reports_batch(self, reports: list[tuple[dict, dict]]) -> int:
+        """Insert multiple reports in a batch.
+
+        All reports are written over a single connection in pipeline mode. If
+        that transaction fails because of the data (one over-long value, a bad
+        date, ...), the reports are retried one at a time so only the offending
+        rows are lost. Connection failures are not retried.
+
+        Args:
+            reports: List of (base_info, specific_data) tuples from scraper
+
+        Returns:
+            int: Number of reports successfully inserted
+        """
+        typed_reports = [
+            (base_info, specific_data, _report_type(base_info))
+            for base_info, specific_data in reports
+        ]
+        try:
+            self._insert_reports(typed_reports)
+        except psycopg.OperationalError as e:
+            logger.error(f"Failed to insert batch of {len(reports)} reports: {e}")
+            return 0
+        except psycopg.Error as e:
+            logger.warning(f"Batch insert failed, inserting reports one by one: {e}")
+            inserted = self._insert_reports_individually(typed_reports)
+        else:
+            inserted = len(reports)
+
+        logger.info(f"Successfully inserted {inserted}/{len(reports)} reports")
+        return inserted
+
+    def _insert_reports_individually(
+        self, reports: list[tuple[dict, dict, str]]
+    ) -> int:
+        """Insert reports in separate transactions, skipping the ones that fail.
+
+        Args:
+            reports: (base_info, specific_data, report_type) triples
+
+        Returns:
+            int: Number of reports inserted before any connection failure
+        """
+        inserted = 0
+        for report in reports:
+            try:
+                self._insert_reports([report])
+            except psycopg.OperationalError as e:
+                logger.error(f"Lost database connection while inserting: {e}")
+                break
+            except psycopg.Error as e:
+                logger.error(f"Failed to insert report {report[0]['report_id']}: {e}")
+                continue
+            inserted += 1
+        return inserted
+
+    def _insert_reports(self, reports: list[tuple[dict, dict, str]]) -> None:
+        """Insert (base_info, specific_data, report_type) triples in bulk.
+
+        Rows are partitioned per table and transposed into one list per column.
+        Reports and avalanches are then inserted with a single
+        ``INSERT ... SELECT FROM UNNEST(...)`` each: one parse, bind and execute
+        regardless of batch size. Observations carry a ``red_flags`` array per
+        row, which UNNEST would flatten, so they go through ``executemany``
+        inside the same pipeline instead.
+        """
+        report_rows, observation_rows, avalanche_rows = _partition_reports(reports)
 
-                # Insert specific data
-                if report_type == "observation":
+        with self.get_connection() as conn:
+            with conn.pipeline(), conn.cursor() as cur:
+                if report_rows:
                     cur.execute(
-                        """
-                        INSERT INTO observations (
-                            report_id, red_flags, new_snow_depth, new_snow_density,
-                            snow_surface_conditions, avy_problem_1, avy_problem_1_trend,
-                            avy_problem_2, avy_problem_2_trend, today_rating, tomorrow_rating
-                        ) VALUES (
-                            %(report_id)s, %(red_flags)s, %(new_snow_depth)s, %(new_snow_density)s,
-                            %(snow_surface_conditions)s, %(avy_problem_1)s, %(avy_problem_1_trend)s,
-                            %(avy_problem_2)s, %(avy_problem_2_trend)s, %(today_rating)s, %(tomorrow_rating)s
-                        )
+                        INSERT_REPORTS_SQL, _transpose(report_rows), prepare=True
+                    )
+                if observation_rows:
+                    cur.executemany(
+                        f"""
+                        INSERT INTO observations ({", ".join(OBSERVATION_COLUMNS)})
+                        VALUES ({", ".join(["%s"] * len(OBSERVATION_COLUMNS))})
                         ON CONFLICT (report_id) DO NOTHING
                         """,
-                        specific_data,
+                        observation_rows,
                     )
-                elif report_type == "avalanche":
+                if avalanche_rows:
                     cur.execute(
-                        """
-                        INSERT INTO avalanches (
-                            report_id, avalanche_date, trigger, trigger_additional,
-                            avalanche_type, problem, weak_layer, depth,
-                            width_feet, vertical_feet, caught, carried
-                        ) VALUES (
-                            %(report_id)s, %(avalanche_date)s, %(trigger)s, %(trigger_additional)s,
-                            %(avalanche_type)s, %(problem)s, %(weak_layer)s, %(depth)s,
-                            %(width_feet)s, %(vertical_feet)s, %(caught)s, %(carried)s
-                        )
-                        ON CONFLICT (report_id) DO NOTHING
-                        """,
-                        specific_data,
+                        INSERT_AVALANCHES_SQL, _transpose(avalanche_rows), prepare=True
                     )
                 # TODO: only log if insert was successful and not skipped due to conflict or duplicate key
-                logger.debug(f"Inserted {report_type} report: {base_info['report_id']}")
+                logger.debug(f"Inserted {len(report_rows)} reports")
 
-    def insert_reports_batch(self, reports: list[tuple[dict, dict]]) -> int:
-        """Insert multiple reports in a batch.
+    def bulk_copy_reports(self, reports: list[tuple[dict, dict]]) -> int:
+        """Load a large batch of reports using the COPY protocol.
+
+        Rows are streamed into temporary staging tables with a single COPY per
+        table and then moved into the real tables with ``ON CONFLICT DO
+        NOTHING``, so duplicates are skipped exactly like ``insert_report``.
+        Prefer this over ``insert_reports_batch`` for backfills.
 
         Args:
             reports: List of (base_info, specific_data) tuples from scraper
 
         Returns:
-            int: Number of reports successfully inserted
+            int: Number of reports successfully loaded
         """
-        inserted = 0
-        for base_info, specific_data in reports:
-            try:
-                # Determine report type from URL
-                report_type = (
-                    "avalanche"
-                    if "/avalanche/" in base_info["report_url"]
-                    else "observation"
-                )
-                self.insert_report(base_info, specific_data, report_type)
-                inserted += 1
-            except Exception as e:
-                logger.error(
-                    f"Failed to insert report {base_info.get('report_id')}: {e}"
-                )
-                continue
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    for table, columns, rows in _copy_batches(reports):
+                        self._copy_rows(cur, table, columns, rows)
+        except psycopg.Error as e:
+            logger.error(f"Failed to copy batch of {len(reports)} reports: {e}")
+            return 0
 
-        logger.info(f"Successfully inserted {inserted}/{len(reports)} reports")
-        return inserted
+        logger.info(f"Successfully copied {len(reports)}/{len(reports)} reports")
+        return len(reports)
+
+    def _copy_rows(
+        self, cur, table: str, columns: tuple[str, ...], rows: list[tuple]
+    ) -> None:
+        """COPY rows into a temporary staging table, then upsert into ``table``."""
+        create_staging, copy_staging, upsert = _copy_statements(table, columns)
+        cur.execute(create_staging)
+        with cur.copy(copy_staging) as copy:
+            for row in rows:
+                copy.write_row(row)
+        cur.execute(upsert)
+        logger.debug(f"Copied {len(rows)} rows into {table}")
+
+    def get_reports_by_date(
+        self, start_date: str, end_date: str = None
+    ) -> Iterator[dict]:
+        """Stream reports within a date range.
+
+        Rows are read through a server-side cursor in chunks of
+        ``FETCH_SIZE``, so wide ranges never sit in client memory all at once.
+        The connection stays checked out until the iterator is exhausted or
+        closed; stopping early rolls the read transaction back.
 
-    def get_reports_by_date(self, start_date: str, end_date: str = None) -> list[dict]:
-        """Retrieve reports within a date range.
+        Note:
+            This returns an iterator, not a list as it used to. Callers that
+            index the result or iterate it twice should wrap it in ``list()``.
 
         Args:
             start_date: Start date in 'YYYY-MM-DD' format
             end_date: End date in 'YYYY-MM-DD' format (optional, defaults to start_date)
 
-        Returns:
-            list[dict]: List of report dictionaries
+        Yields:
+            dict: One report dictionary per row
         """
         if end_date is None:
             end_date = start_date
 
         with self.get_connection() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(name="reports_by_date", row_factory=dict_row) as cur:
+                cur.itersize = FETCH_SIZE
                 cur.execute(
                     """
                     SELECT 
@@ -196,15 +480,17 @@ class DatabaseManager:
                     """,
                     (start_date, end_date),
                 )
-
-                columns = [desc[0] for desc in cur.description]
-                return [dict(zip(columns, row)) for row in cur.fetchall()]
+                yield from cur
 
     def get_reports_near_location(
         self, latitude: float, longitude: float, radius_km: float = 10
     ) -> list[dict]:
         """Find reports within a radius of a geographic point.
 
+        The search runs in the ``get_nearby_reports`` database function (see
+        init.sql), which prefilters with a bounding box on the indexed ``geom``
+        column before the exact geography distance check.
+
         Args:
             latitude: Latitude in decimal degrees
             longitude: Longitude in decimal degrees
@@ -214,29 +500,12 @@ class DatabaseManager:
             list[dict]: List of nearby reports with distance
         """
         with self.get_connection() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(row_factory=dict_row) as cur:
                 cur.execute(
-                    """
-                    SELECT 
-                        report_id, report_type, observation_date, location_name,
-                        ST_Y(geom) as latitude, ST_X(geom) as longitude,
-                        ST_Distance(
-                            geom::geography,
-                            ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
-                        ) / 1000 as distance_km
-                    FROM reports
-                    WHERE ST_DWithin(
-                        geom::geography,
-                        ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography,
-                        %s
-                    )
-                    ORDER BY distance_km
-                    """,
-                    (longitude, latitude, longitude, latitude, radius_km * 1000),
+                    "SELECT * FROM get_nearby_reports(%s, %s, %s)",
+                    (latitude, longitude, radius_km * 1000),
                 )
-
-                columns = [desc[0] for desc in cur.description]
-                return [dict(zip(columns, row)) for row in cur.fetchall()]
+                return cur.fetchall()
 
     def get_statistics(self) -> dict[str, Any]:
         """Get database statistics.
@@ -265,3 +534,100 @@ class DatabaseManager:
                     "earliest_date": result[3],
                     "latest_date": result[4],
                 }
+
+
+@functools.lru_cache(maxsize=1)
+def get_db() -> DatabaseManager:
+    """Return the process-wide DatabaseManager configured from the environment.
+
+    Sharing one manager keeps every caller on the same connection pool.
+    """
+    return DatabaseManager()
+
+
+class AsyncDatabaseManager:
+    """Asyncio counterpart of DatabaseManager for high-throughput ingestion.
+
+    Connections come from a psycopg ``AsyncConnectionPool``, so inserts can be
+    awaited alongside other I/O. The pool must be opened before use, either
+    with ``await db.open()`` or ``async with AsyncDatabaseManager() as db``.
+    On Windows, run it on a ``SelectorEventLoop``.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 5432,
+        database: str = "gis",
+        user: str = os.getenv("POSTGRES_USER"),
+        password: str = os.getenv("POSTGRES_PASSWORD"),
+    ):
+        """Initialize database connection parameters and the (closed) pool.
+
+        Args:
+            host: Database host address
+            port: Database port number
+            database: Database name
+            user: Database username
+            password: Database password
+        """
+        self.conn_params = {
+            "host": host,
+            "port": port,
+            "dbname": database,
+            "user": user,
+            "password": password,
+        }
+        self._pool = AsyncConnectionPool(
+            make_conninfo("", **self.conn_params),
+            min_size=POOL_MIN_SIZE,
+            max_size=POOL_MAX_SIZE,
+            kwargs={"prepare_threshold": PREPARE_THRESHOLD},
+            open=False,
+        )
+        logger.info(f"Async database manager initialized for {host}:{port}/{database}")
+
+    async def open(self) -> None:
+        """Open the connection pool."""
+        await self._pool.open()
+
+    async def close(self) -> None:
+        """Close the connection pool and all its connections."""
+        await self._pool.close()
+
+    async def __aenter__(self) -> "AsyncDatabaseManager":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def insert_reports_batch(self, reports: list[tuple[dict, dict]]) -> int:
+        """Insert multiple reports using the COPY protocol.
+
+        Uses the same staging-table COPY and ``ON CONFLICT DO NOTHING`` upsert
+        as ``DatabaseManager.bulk_copy_reports``.
+
+        Args:
+            reports: List of (base_info, specific_data) tuples from scraper
+
+        Returns:
+            int: Number of reports successfully inserted
+        """
+        try:
+            async with self._pool.connection() as conn, conn.cursor() as cur:
+                for table, columns, rows in _copy_batches(reports):
+                    create_staging, copy_staging, upsert = _copy_statements(
+                        table, columns
+                    )
+                    await cur.execute(create_staging)
+                    async with cur.copy(copy_staging) as copy:
+                        for row in rows:
+                            await copy.write_row(row)
+                    await cur.execute(upsert)
+        except psycopg.Error as e:
+            logger.error(f"Failed to insert batch of {len(reports)} reports: {e}")
+            return 0
+
+        logger.info(f"Successfully inserted {len(reports)}/{len(reports)} reports")
+        return len(reports)
@@ -140,12 +140,15 @@ JOIN avalanches a ON r.report_id = a.report_id
 LEFT JOIN regions reg ON r.region_id = reg.id
 WHERE r.report_type = 'avalanche';
 
+-- Spatial search columns and functions are added by migrations/, which
+-- setup_db.py applies after this script.
+
 -- Example spatial queries you can run:
 
 -- Find all reports within 10km of a point (Salt Lake City example)
 -- SELECT * FROM reports 
 -- WHERE ST_DWithin(
---     geom::geography,
+--     geog,
 --     ST_SetSRID(ST_MakePoint(-111.8910, 40.7608), 4326)::geography,
 --     10000
 -- );
@@ -0,0 +1,107 @@
+-- Spatial search support for the reports table: a geography column for
+-- metre-based radius queries, a packed unit vector used as a coarse
+-- prefilter, their indexes and get_nearby_reports(). Every statement is
+-- idempotent, so this can be run on a fresh schema or an existing database.
+
+-- Scale one component of a unit vector (-1..1) into the INT2 range. Packing
+-- the point's 3D unit vector this way keeps the (cx, cy, cz) index about a
+-- quarter the size of a GiST index, so it stays in memory; the resolution
+-- is ~200 m on the Earth's surface.
+CREATE OR REPLACE FUNCTION unit_vector_i2(component FLOAT8) RETURNS INT2
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+AS $$ SELECT round(component * 32400)::INT2 $$;
+
+ALTER TABLE reports
+    ADD COLUMN IF NOT EXISTS geog GEOGRAPHY(Point, 4326)
+        GENERATED ALWAYS AS (geom::geography) STORED,
+    -- Packed unit vector of geom, used as a coarse spatial prefilter
+    ADD COLUMN IF NOT EXISTS cx INT2 GENERATED ALWAYS AS (
+        unit_vector_i2(cos(radians(ST_Y(geom))) * cos(radians(ST_X(geom))))
+    ) STORED,
+    ADD COLUMN IF NOT EXISTS cy INT2 GENERATED ALWAYS AS (
+        unit_vector_i2(cos(radians(ST_Y(geom))) * sin(radians(ST_X(geom))))
+    ) STORED,
+    ADD COLUMN IF NOT EXISTS cz INT2 GENERATED ALWAYS AS (
+        unit_vector_i2(sin(radians(ST_Y(geom))))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_reports_geog ON reports USING GIST (geog);
+CREATE INDEX IF NOT EXISTS idx_reports_xyz ON reports (cx, cy, cz);
+
+-- Find reports within radius_m metres of a point, nearest first. A padded
+-- lat/lon envelope and a range on the packed unit vector let either the GiST
+-- index on geom or the compact (cx, cy, cz) index discard most rows, then
+-- ST_DWithin on the geography column refines the survivors.
+CREATE OR REPLACE FUNCTION get_nearby_reports(lat FLOAT8, lon FLOAT8, radius_m FLOAT8)
+RETURNS TABLE (
+    report_id VARCHAR,
+    report_type VARCHAR,
+    observation_date DATE,
+    location_name TEXT,
+    latitude FLOAT8,
+    longitude FLOAT8,
+    distance_km FLOAT8
+)
+LANGUAGE plpgsql STABLE AS $$
+DECLARE
+    pt GEOGRAPHY := ST_SetSRID(ST_MakePoint(lon, lat), 4326)::geography;
+    -- ~111.32 km per degree, padded by 10% so the box never undercuts the circle
+    lat_delta FLOAT8 := radius_m / 111320.0 * 1.1;
+    lon_delta FLOAT8 := 180;
+    box GEOMETRY;
+    -- Second half of the box when it crosses the antimeridian
+    wrap_box GEOMETRY;
+    -- Any point within radius_m has unit-vector components within the chord
+    -- length of the query point's; padded by 10% plus one rounding step
+    xyz_delta INT4 := ceil(2 * sin(radius_m / 6371008.8 / 2) * 1.1 * 32400) + 1;
+    ux INT4 := unit_vector_i2(cos(radians(lat)) * cos(radians(lon)));
+    uy INT4 := unit_vector_i2(cos(radians(lat)) * sin(radians(lon)));
+    uz INT4 := unit_vector_i2(sin(radians(lat)));
+BEGIN
+    -- Size the longitude span at the circle's poleward edge; a circle that
+    -- reaches a pole spans every longitude
+    IF abs(lat) + lat_delta < 90 THEN
+        lon_delta := LEAST(
+            radius_m / (111320.0 * cos(radians(abs(lat) + lat_delta))) * 1.1, 180
+        );
+    END IF;
+
+    IF lon_delta >= 180 THEN
+        box := ST_MakeEnvelope(
+            -180, GREATEST(lat - lat_delta, -90), 180, LEAST(lat + lat_delta, 90), 4326
+        );
+    ELSE
+        box := ST_MakeEnvelope(
+            GREATEST(lon - lon_delta, -180), GREATEST(lat - lat_delta, -90),
+            LEAST(lon + lon_delta, 180), LEAST(lat + lat_delta, 90),
+            4326
+        );
+        IF lon - lon_delta < -180 THEN
+            wrap_box := ST_MakeEnvelope(
+                lon - lon_delta + 360, GREATEST(lat - lat_delta, -90),
+                180, LEAST(lat + lat_delta, 90),
+                4326
+            );
+        ELSIF lon + lon_delta > 180 THEN
+            wrap_box := ST_MakeEnvelope(
+                -180, GREATEST(lat - lat_delta, -90),
+                lon + lon_delta - 360, LEAST(lat + lat_delta, 90),
+                4326
+            );
+        END IF;
+    END IF;
+
+    RETURN QUERY
+    SELECT
+        r.report_id, r.report_type, r.observation_date, r.location_name,
+        ST_Y(r.geom), ST_X(r.geom),
+        ST_Distance(r.geog, pt) / 1000
+    FROM reports r
+    WHERE (r.geom && box OR r.geom && wrap_box)
+        AND r.cx BETWEEN ux - xyz_delta AND ux + xyz_delta
+        AND r.cy BETWEEN uy - xyz_delta AND uy + xyz_delta
+        AND r.cz BETWEEN uz - xyz_delta AND uz + xyz_delta
+        AND ST_DWithin(r.geog, pt, radius_m)
+    ORDER BY 7;
+END;
+$$;
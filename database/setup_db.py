@@ -1,12 +1,13 @@
 import logging
 import sys
 from pathlib import Path
-from database.db_manager import DatabaseManager
+from database.db_manager import get_db
 
 """
 Database initialization and setup script.
 
 Run using pixi run python database/setup_db.py
+Upgrade an existing database with pixi run python database/setup_db.py --migrate
 """
 
 # Add parent directory to path to import database module
@@ -19,11 +20,16 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Idempotent schema upgrades, applied in file name order
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
 
-def initialize_database():
-    """Initialize the database with schema from init.sql."""
-    db = DatabaseManager()
 
+def initialize_database(conn) -> bool:
+    """Initialize the database with schema from init.sql.
+
+    Args:
+        conn: Open database connection to run the schema on.
+    """
     # Read SQL file
     sql_file = Path(__file__).parent / "init.sql"
     with open(sql_file, "r") as f:
@@ -32,10 +38,11 @@ def initialize_database():
     logger.info("Initializing database schema...")
 
     try:
-        with db.get_connection() as conn:
-            with conn.cursor() as cur:
-                # Execute the entire SQL script
-                cur.execute(sql_script)
+        with conn.cursor() as cur:
+            # Execute the entire SQL script
+            cur.execute(sql_script)
+        # Commit now so a failed verification cannot roll the schema back
+        conn.commit()
         logger.info("Database schema initialized successfully!")
         return True
     except Exception as e:
@@ -43,48 +50,62 @@ def initialize_database():
         return False
 
 
-def verify_setup():
-    """Verify the database setup is correct."""
-    db = DatabaseManager()
+def apply_migrations(conn) -> bool:
+    """Apply every script in migrations/ in file name order.
+
+    The scripts are idempotent, so this is safe on a fresh schema and on a
+    database created before they were added.
 
+    Args:
+        conn: Open database connection to run the migrations on.
+    """
     try:
-        with db.get_connection() as conn:
-            with conn.cursor() as cur:
-                # Check PostGIS extension
-                cur.execute("SELECT PostGIS_Version();")
-                postgis_version = cur.fetchone()[0]
-                logger.info(f"PostGIS version: {postgis_version}")
-
-                # Check tables
-                cur.execute(
-                    """
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_type = 'BASE TABLE'
-                    ORDER BY table_name;
-                    """
-                )
-                tables = [row[0] for row in cur.fetchall()]
-                logger.info(f"Tables created: {', '.join(tables)}")
-
-                # Check views
-                cur.execute(
-                    """
-                    SELECT table_name 
-                    FROM information_schema.views 
-                    WHERE table_schema = 'public'
-                    ORDER BY table_name;
-                    """
-                )
-                views = [row[0] for row in cur.fetchall()]
-                logger.info(f"Views created: {', '.join(views)}")
-
-                # Check regions
-                cur.execute("SELECT COUNT(*) FROM regions;")
-                region_count = cur.fetchone()[0]
-                logger.info(f"Regions loaded: {region_count}")
+        with conn.cursor() as cur:
+            for sql_file in sorted(MIGRATIONS_DIR.glob("*.sql")):
+                logger.info(f"Applying migration {sql_file.name}...")
+                cur.execute(sql_file.read_text())
+        conn.commit()
+        logger.info("Migrations applied successfully!")
+        return True
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Failed to apply migrations: {e}")
+        return False
+
 
+def verify_setup(conn) -> bool:
+    """Verify the database setup is correct.
+
+    Args:
+        conn: Open database connection to inspect.
+    """
+    try:
+        with conn.cursor() as cur:
+            # Check PostGIS, tables, views and regions in one round-trip
+            cur.execute(
+                """
+                SELECT
+                    PostGIS_Version(),
+                    (
+                        SELECT array_agg(table_name::text ORDER BY table_name)
+                        FROM information_schema.tables
+                        WHERE table_schema = 'public'
+                        AND table_type = 'BASE TABLE'
+                    ),
+                    (
+                        SELECT array_agg(table_name::text ORDER BY table_name)
+                        FROM information_schema.views
+                        WHERE table_schema = 'public'
+                    ),
+                    (SELECT COUNT(*) FROM regions);
+                """
+            )
+            postgis_version, tables, views, region_count = cur.fetchone()
+
+        logger.info(f"PostGIS version: {postgis_version}")
+        logger.info(f"Tables created: {', '.join(tables or [])}")
+        logger.info(f"Views created: {', '.join(views or [])}")
+        logger.info(f"Regions loaded: {region_count}")
         logger.info("Database setup verification complete!")
         return True
     except Exception as e:
@@ -98,8 +119,11 @@ if __name__ == "__main__":
     print("=" * 60)
     print()
 
-    if initialize_database():
+    # Schema setup and verification share one pooled connection
+    with get_db().get_connection() as conn:
+        if "--migrate" not in sys.argv[1:] and not initialize_database(conn):
+            sys.exit(1)
+        if not apply_migrations(conn):
+            sys.exit(1)
         print()
-        verify_setup()
-    else:
-        sys.exit(1)
+        verify_setup(conn)
@@ -50,6 +50,15 @@ class SnowPilotError(ScraperError):
         super().__init__(self.message)
 
 
+class StorageError(ScraperError):
+    """Raised when scraped reports cannot be written to the database."""
+
+    def __init__(self, count: int, message: str = "Failed to store reports"):
+        self.count = count
+        self.message = f"{message}: {count} not saved"
+        super().__init__(self.message)
+
+
 class RegionNotFoundError(ScraperError):
     """Raised when a specified region is not recognized."""
 
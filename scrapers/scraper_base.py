@@ -1,10 +1,181 @@
 import logging
+import threading
+import time
 import requests
+import urllib3
 from abc import ABC
+from urllib.parse import urlsplit
+from urllib.request import getproxies, proxy_bypass
+from requests.adapters import HTTPAdapter
+from urllib3 import BaseHTTPResponse
+from urllib3.util import Retry
 from .exceptions import NetworkError
 
 logger = logging.getLogger(__name__)
 
+# Response codes worth retrying with backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Unthrottled responses in a row before a slowed RateLimiter doubles its rate
+RECOVERY_AFTER = 20
+
+
+def create_retry() -> Retry:
+    """Build the retry policy shared by the scrapers' HTTP clients.
+
+    Returns:
+        Retry: Retries transient failures with backoff, honouring Retry-After.
+        Once retries run out the last response is returned so callers can
+        inspect its status.
+    """
+    return Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+
+
+def create_session(
+    pool_connections: int = 10, pool_maxsize: int = 50
+) -> requests.Session:
+    """Create a session with pooled keep-alive connections and retries.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum connections kept alive per host.
+
+    Returns:
+        requests.Session: Session retrying per ``create_retry``.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=create_retry(),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_pool_manager(
+    url: str, maxsize: int, headers: dict[str, str]
+) -> urllib3.PoolManager:
+    """Create a urllib3 pool for one site, honouring the proxy environment.
+
+    Unlike ``requests``, urllib3 ignores HTTP(S)_PROXY and NO_PROXY, so they
+    are resolved here once for the site's host.
+
+    Args:
+        url: Any URL on the site the pool will talk to.
+        maxsize: Maximum connections kept alive to the site.
+        headers: Headers sent with every request.
+
+    Returns:
+        urllib3.PoolManager: A ProxyManager when the site should be proxied.
+    """
+    parts = urlsplit(url)
+    proxy = getproxies().get(parts.scheme)
+    if proxy and not proxy_bypass(parts.hostname):
+        logger.info(f"Using proxy {proxy} for {parts.hostname}")
+        return urllib3.ProxyManager(
+            proxy, num_pools=1, maxsize=maxsize, headers=headers, retries=create_retry()
+        )
+    return urllib3.PoolManager(
+        num_pools=1, maxsize=maxsize, headers=headers, retries=create_retry()
+    )
+
+
+def was_throttled(response: BaseHTTPResponse) -> bool:
+    """Check whether the server answered 429 to a request or any of its retries.
+
+    Args:
+        response: Final urllib3 response (``Response.raw`` under requests).
+
+    Returns:
+        bool: True if a 429 was seen, even one that was retried past.
+    """
+    history = response.retries.history if response.retries else ()
+    return response.status == 429 or any(r.status == 429 for r in history)
+
+
+def retry_after(response: BaseHTTPResponse) -> int | None:
+    """Read a Retry-After header given in seconds, or None if absent/invalid."""
+    try:
+        return int(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Token bucket limiting how often requests may start across threads.
+
+    Callers that find the bucket empty reserve the next token and sleep until
+    it is due outside the lock, so other threads are never blocked on them.
+
+    Attributes:
+        rate (float): Tokens added per second; lowered by ``slow_down`` and
+            restored by ``speed_up``.
+        max_rate (float): Rate the limiter was created with.
+        min_rate (float): Lowest rate ``slow_down`` will go to.
+        capacity (int): Maximum number of tokens that can accumulate.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Sustained requests allowed per second.
+            capacity: Requests allowed back to back after an idle period.
+        """
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = rate / 16
+        self.capacity = capacity
+        self._successes = 0
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+    def slow_down(self) -> None:
+        """Halve the sustained rate after the server pushed back, within a floor."""
+        with self._lock:
+            self.rate = max(self.rate / 2, self.min_rate)
+            self._successes = 0
+            logger.warning(f"Rate limited by server, slowing to {self.rate:g} req/s")
+
+    def speed_up(self) -> None:
+        """Record a request the server accepted without pushing back.
+
+        After ``RECOVERY_AFTER`` of them in a row the rate doubles, up to the
+        rate the limiter was created with.
+        """
+        with self._lock:
+            if self.rate >= self.max_rate:
+                return
+            self._successes += 1
+            if self._successes < RECOVERY_AFTER:
+                return
+            self._successes = 0
+            self.rate = min(self.rate * 2, self.max_rate)
+            logger.info(
+                f"Server no longer rate limiting, raising to {self.rate:g} req/s"
+            )
+
 
 class BaseScraper(ABC):
     """Abstract base class for all avalanche data scrapers.
@@ -14,8 +185,11 @@ class BaseScraper(ABC):
 
     Attributes:
         base_url (str): The base URL for the scraper.
+        _session (requests.Session): Keep-alive session shared by all scrapers.
     """
 
+    _session = create_session()
+
     def __init__(self, base_url: str):
         """Initialize the scraper with a base URL.
 
@@ -36,7 +210,7 @@ class BaseScraper(ABC):
         """
         try:
             logger.debug(f"Fetching data from {self.base_url}")
-            response = requests.get(self.base_url, timeout=10)
+            response = self._session.get(self.base_url, timeout=10)
             response.raise_for_status()
             logger.info(f"Successfully fetched data from {self.base_url}")
             return response.text
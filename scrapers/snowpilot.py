@@ -1,13 +1,27 @@
+import html
+import io
 import logging
+import math
 import re
 import requests
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
-from .exceptions import SnowPilotError
+from lxml import etree
+from .exceptions import NetworkError, ParsingError, ScraperError, SnowPilotError
+from .scraper_base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# First <a href="..."> whose text mentions XML, e.g. <a href="/x.xml">View XML</a>
+_XML_LINK_RE = re.compile(rb'<a\s[^>]*href="([^"]+)"[^>]*>[^<]*xml', re.IGNORECASE)
+
+# Number embedded in a decorated value such as "225°"
+_DEG_RE = re.compile(r"[\d.]+")
+
+# 8-point compass, clockwise from north in 45 degree sectors
+_COMPASS_POINTS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
 
 class SnowPilotClient:
     """Client for fetching and parsing SnowPilot XML snow profile data.
@@ -18,52 +32,166 @@ class SnowPilotClient:
 
     Attributes:
         url (str): The URL to the SnowPilot HTML page.
-        _root (ET.Element): The root element of the parsed XML document.
+        session (requests.Session): Session used for both HTTP requests.
+        _profile (dict): Profile attributes read from the XML document.
     """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, session: requests.Session | None = None):
         """Initialize the SnowPilot client and load XML data.
 
         Args:
             url (str): URL to the SnowPilot HTML page containing XML link.
+            session (requests.Session | None): Session to reuse. Defaults to the
+                keep-alive session shared by the scrapers.
 
         Raises:
-            SnowPilotError: If XML data cannot be loaded.
+            NetworkError: If the page or XML cannot be downloaded.
+            ParsingError: If the XML document is malformed.
+            SnowPilotError: If the page has no XML link.
         """
         self.url = url
+        self.session = session or BaseScraper._session
         logger.info(f"Initializing SnowPilot client for: {url}")
-        self._root = self._load_xml()
-        if self._root is None:
+        self._profile = self._load_xml()
+        if self._profile is None:
             raise SnowPilotError(url, "Failed to load SnowPilot XML data")
 
-    def _load_xml(self) -> ET.Element | None:
-        self._root = None
-        try:
-            logger.info("Fetching SnowPilot page: %s", self.url)
-            soup = BeautifulSoup(requests.get(self.url, timeout=10).text, "html.parser")
-            xml_href = next(
-                (
-                    a["href"]
-                    for a in soup.find_all("a", href=True)
-                    if "xml" in a.text.lower()
-                ),
-                None,
-            )
-            if xml_href is None:
-                logger.warning("SnowPilot XML link not found")
-                return None
+    @classmethod
+    def fetch_many(
+        cls,
+        urls: list[str],
+        session: requests.Session | None = None,
+        max_workers: int = 16,
+    ) -> dict[str, "SnowPilotClient | None"]:
+        """Load several SnowPilot profiles concurrently.
+
+        Each profile costs two blocking HTTP requests, so they are loaded on a
+        thread pool sharing one session instead of one after another.
+
+        Args:
+            urls (list[str]): SnowPilot page URLs; duplicates are loaded once.
+            session (requests.Session | None): Session to reuse for every load.
+            max_workers (int): Maximum number of profiles loaded at once.
+
+        Returns:
+            dict: Mapping of URL to its client, or None if loading failed.
+        """
+        profiles = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(cls, url, session): url for url in dict.fromkeys(urls)
+            }
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    profiles[url] = future.result()
+                except ScraperError as e:
+                    logger.warning(f"Skipping SnowPilot profile: {e}")
+                    profiles[url] = None
+        return profiles
+
+    def _load_xml(self) -> dict[str, str] | None:
+        """
+        Download the SnowPilot page, follow its XML link and parse the profile.
 
-            xml_url = urljoin(self.url, xml_href)
-            logger.info("Downloading SnowPilot XML: %s", xml_url)
+        Transient failures are retried by the session's adapter before they
+        surface here; HTTP error statuses fail immediately rather than being
+        parsed as a profile.
 
-            xml = requests.get(xml_url, timeout=10).content
-            self._root = ET.fromstring(xml)
-            return self._root
+        Returns:
+            dict[str, str] | None: Profile attributes, or None if the page has
+            no XML link.
 
-        except Exception:
-            logger.exception("Failed to load SnowPilot XML")
+        Raises:
+            NetworkError: If either request fails or returns an error status.
+            ParsingError: If the XML document is malformed.
+        """
+        logger.info("Fetching SnowPilot page: %s", self.url)
+        xml_href = self._find_xml_href(self._get(self.url))
+        if xml_href is None:
+            logger.warning("SnowPilot XML link not found")
             return None
 
+        xml_url = urljoin(self.url, xml_href)
+        logger.info("Downloading SnowPilot XML: %s", xml_url)
+
+        try:
+            return self._parse_profile(self._get(xml_url))
+        except etree.XMLSyntaxError as e:
+            raise ParsingError("SnowPilot XML", str(e)) from e
+
+    def _get(self, url: str) -> bytes:
+        """
+        Fetch a URL with the client's session.
+
+        Args:
+            url: URL to fetch.
+
+        Returns:
+            bytes: Response body.
+
+        Raises:
+            NetworkError: If the request fails or returns an error status.
+        """
+        try:
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise NetworkError(url, str(e)) from e
+        return response.content
+
+    def _find_xml_href(self, content: bytes) -> str | None:
+        """
+        Find the href of the link to the profile's XML export.
+
+        A targeted regex handles the usual markup without building a DOM; pages
+        where the link text is wrapped in other tags fall back to BeautifulSoup.
+
+        Args:
+            content: Raw HTML of the SnowPilot page.
+
+        Returns:
+            str | None: The link target, or None if the page has no XML link.
+        """
+        match = _XML_LINK_RE.search(content)
+        if match:
+            return html.unescape(match.group(1).decode(errors="replace"))
+
+        soup = BeautifulSoup(content, "lxml")
+        return next(
+            (
+                a["href"]
+                for a in soup.find_all("a", href=True)
+                if "xml" in a.text.lower()
+            ),
+            None,
+        )
+
+    def _parse_profile(self, xml: bytes) -> dict[str, str]:
+        """
+        Read the profile attributes from SnowPilot XML without building the tree.
+
+        The root element carries aspect, incline, lat and longitude; elevation
+        is the ``elv`` attribute of the ``Location`` element. Parsing stops as
+        soon as ``Location`` is reached.
+
+        Args:
+            xml: Raw XML document.
+
+        Returns:
+            dict[str, str]: Root attributes plus ``elv`` when present.
+        """
+        profile = None
+        for _, element in etree.iterparse(
+            io.BytesIO(xml), events=("start",), collect_ids=False
+        ):
+            if profile is None:
+                profile = dict(element.attrib)
+            elif element.tag == "Location":
+                profile["elv"] = element.get("elv")
+                break
+        return profile
+
     def _degrees_to_compass(self, degrees) -> str | None:
         """
         Convert degrees to 8-point compass direction.
@@ -77,36 +205,41 @@ class SnowPilotClient:
         if degrees is None:
             return None
         try:
-            degrees = float("".join(re.findall(r"[\d\.]+", degrees)))
-            directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-            index = round(degrees / 45) % 8
-            return directions[index]
+            degrees = float(degrees)
         except (ValueError, TypeError):
+            match = _DEG_RE.search(str(degrees))
+            try:
+                degrees = float(match.group())
+            except (AttributeError, ValueError):
+                return None
+        if not math.isfinite(degrees):
             return None
+        # Nearest heading; exact half-way values round half to even
+        return _COMPASS_POINTS[round(degrees / 45) % 8]
 
     @property
     def aspect(self) -> str | None:
-        aspect_degrees = self._root.get("aspect") if self._root else None
-        return self._degrees_to_compass(aspect_degrees)
+        return self._degrees_to_compass(self._profile.get("aspect"))
+
+    def _get_float(self, key: str) -> float | None:
+        """Read a numeric profile attribute as a float, or None if absent/invalid."""
+        try:
+            return float(self._profile[key])
+        except (KeyError, TypeError, ValueError):
+            return None
 
     @property
-    def slope_angle(self) -> str | None:
-        incline = self._root.get("incline") if self._root else None
-        return incline if incline else None
+    def slope_angle(self) -> float | None:
+        return self._get_float("incline")
 
     @property
-    def elevation(self) -> str | None:
-        if self._root is None:
-            return None
-        location = self._root.find("Location")
-        if location is not None:
-            return location.get("elv")
-        return None
+    def elevation(self) -> float | None:
+        return self._get_float("elv")
 
     @property
-    def latitude(self) -> str | None:
-        return self._root.get("lat") if self._root else None
+    def latitude(self) -> float | None:
+        return self._get_float("lat")
 
     @property
-    def longitude(self) -> str | None:
-        return self._root.get("longitude") if self._root else None
+    def longitude(self) -> float | None:
+        return self._get_float("longitude")
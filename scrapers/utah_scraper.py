@@ -1,16 +1,29 @@
 import logging
-from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
+import urllib3
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
-import time
+from urllib.parse import urlencode
 import re
 
-from .scraper_base import BaseScraper
+from .scraper_base import (
+    BaseScraper,
+    RateLimiter,
+    create_pool_manager,
+    retry_after,
+    was_throttled,
+)
 from .snowpilot import SnowPilotClient
-from .exceptions import NetworkError
-from .utils import convert_to_inches, clean_numeric
-from database.db_manager import DatabaseManager
+from .exceptions import (
+    NetworkError,
+    RateLimitError,
+    ScraperError,
+    SnowPilotError,
+    StorageError,
+)
+from .utils import convert_to_inches, clean_numeric, parse_long_date
+from database.db_manager import get_db
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +38,41 @@ HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
+# Report pages fetched at once. The default request rate matches the old
+# one-second delay between pages, so concurrency only overlaps round trips
+PAGE_FETCH_WORKERS = 8
+PAGE_REQUESTS_PER_SECOND = 1
+
+# Inline script holding the observation map settings
+_BACKDROP_RE = re.compile("window.Backdrop")
+
+# Point WKT in the map settings, e.g. "wkt":"POINT (-111.6 40.6)"
+_GEOFIELD_KEY = 'geofield_formatter"'
+_WKT_POINT = '"wkt":"POINT ('
+_WKT_RE = re.compile(
+    r'geofield_formatter"\s*:\s*\{.*?"wkt"\s*:\s*"POINT \(([-\d.]+) ([-\d.]+)\)"',
+    re.DOTALL,
+)
+
+# Numeric runs in a decorated value such as "38°"
+_NUM_RE = re.compile(r"[\d\.]+")
+
+# Site root, requested once up front so workers find a warm TLS connection
+UAC_ROOT = "https://utahavalanchecenter.org"
+OBSERVATIONS_URL = f"{UAC_ROOT}/observations"
+
+# Report page elements the parsers read; anything outside them is skipped
+_REPORT_STRAINER = SoupStrainer(["div", "fieldset", "script"])
+
+# Div whose own text mentions the red flags label
+_RED_FLAGS_SELECTOR = 'div:-soup-contains-own("Red Flags")'
+
+# First table in the search results, whose anchors are the report links
+_RESULTS_TABLE_XPATH = (
+    '(//div[contains(concat(" ", normalize-space(@class), " "), " view-content ")]'
+    "//table)[1]"
+)
+
 # Mapping of Utah avalanche forecast region names to their numeric IDs
 lookup = {
     "Logan": 1,
@@ -54,25 +102,55 @@ class UtahScraper(BaseScraper):
         month (str): Two-digit month.
         year (str): Four-digit year.
         url (str): Constructed URL for the observation query.
-        session (requests.Session): Persistent session with browser headers.
+        pool (urllib3.PoolManager): Pooled, retrying connections with browser headers.
     """
 
-    def __init__(self, date: tuple[str, str, str]):
+    def __init__(
+        self,
+        date: tuple[str, str, str],
+        requests_per_second: float = PAGE_REQUESTS_PER_SECOND,
+    ):
         """Initialize the Utah scraper with a specific date.
 
         Args:
             date: Tuple of (day, month, year) as strings with leading zeros.
                   Example: ('15', '12', '2024')
+            requests_per_second: Report pages requested per second, one at a
+                time. Raise only when the site is known to allow it.
         """
         self.day, self.month, self.year = date
-        self.url = f"https://utahavalanchecenter.org/observations?term=All&fodv%5Bmin%5D%5Bdate%5D={self.month}%2F{self.day}%2F{self.year}&fodv%5Bmax%5D%5Bdate%5D={self.month}%2F{self.day}%2F{self.year}"
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+        observed = f"{self.month}/{self.day}/{self.year}"
+        query = urlencode(
+            [
+                ("term", "All"),
+                ("fodv[min][date]", observed),
+                ("fodv[max][date]", observed),
+            ]
+        )
+        self.url = f"{OBSERVATIONS_URL}?{query}"
+        # Every request goes to one host, so urllib3 is used directly rather
+        # than paying for requests' per-call session bookkeeping
+        self.pool = create_pool_manager(UAC_ROOT, PAGE_FETCH_WORKERS * 2, HEADERS)
+        self._warm_up()
+        self._rate_limiter = RateLimiter(requests_per_second)
+        self._snowpilot_profiles: dict[str, SnowPilotClient | None] = {}
+        # Report type (first URL path segment) to the method that normalizes it
+        self._normalizers = {
+            "avalanche": self._normalize_avalanche,
+            "observation": self._normalize_observation,
+        }
         logger.info(
             f"Initialized UtahScraper for date: {self.year}-{self.month}-{self.day}"
         )
         super().__init__(self.url)
 
+    def _warm_up(self) -> None:
+        """Open a keep-alive connection to the site before the page workers start."""
+        try:
+            self.pool.request("HEAD", UAC_ROOT, timeout=10)
+        except urllib3.exceptions.HTTPError as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+
     def get_field_value(self, web_access: BeautifulSoup, label_text: str) -> str | None:
         """Extract field value from observation page by label text.
 
@@ -90,93 +168,135 @@ class UtahScraper(BaseScraper):
         value_div = label.find_next_sibling("div")
         return value_div.get_text(strip=True) if value_div else None
 
+    def _build_field_map(self, web_access: BeautifulSoup) -> dict[str, str | None]:
+        """Collect every labelled field on a page in a single pass.
+
+        Equivalent to calling ``get_field_value`` for each label, without
+        searching the whole document once per label.
+
+        Args:
+            web_access: BeautifulSoup object of the observation page.
+
+        Returns:
+            dict: Mapping of label text to value text (None if the label has no
+            value); the first occurrence of a repeated label wins.
+        """
+        fields = {}
+        for label in web_access.find_all("div", class_="field-label"):
+            value_div = label.find_next_sibling("div")
+            fields.setdefault(
+                label.get_text(strip=True),
+                value_div.get_text(strip=True) if value_div else None,
+            )
+        return fields
+
     def get_lat_lon(
-        self, web_access: BeautifulSoup
+        self,
+        coordinates: tuple[float | None, float | None],
+        fields: dict[str, str | None],
     ) -> tuple[float | None, float | None]:
         """
-        Extract latitude and longitude coordinates from observation page.
+        Resolve latitude and longitude coordinates for an observation page.
 
-        Attempts to extract coordinates from the embedded map script. If not found,
+        Uses the coordinates from the embedded map script. If there are none,
         falls back to SnowPilot profile if available.
 
         Args:
-            web_access: BeautifulSoup object of the observation page.
+            coordinates: (longitude, latitude) from ``_get_map_coordinates``.
+            fields: Field map of the page from ``_build_field_map``.
 
         Returns:
             tuple: (longitude, latitude) or (None, None) if unavailable.
         """
-        script_tag = web_access.find("script", string=re.compile("window.Backdrop"))
-        # Directly search for the POINT WKT in the script text
-        match = re.search(
-            r'geofield_formatter"\s*:\s*\{.*?"wkt"\s*:\s*"POINT \(([-\d.]+) ([-\d.]+)\)"',
-            script_tag.string,
-            re.DOTALL,
-        )
-        longitude, latitude = None, None
-        if match:
-            longitude = float(match.group(1))
-            latitude = float(match.group(2))
+        longitude, latitude = coordinates
+        if longitude is not None:
             logger.debug(f"Extracted coordinates from map: ({longitude}, {latitude})")
             return longitude, latitude
         else:  # try to check if there is a snowprofile
             logger.debug("Coordinates not found in map, checking SnowPilot")
-            snowpilot_table = self.get_field_value(web_access, "Snow Pilot URL")
+            snowpilot_table = fields.get("Snow Pilot URL")
             if snowpilot_table is None:
                 logger.debug("No SnowPilot URL available")
                 return longitude, latitude
             try:
-                snowpilot = SnowPilotClient(snowpilot_table)
+                snowpilot = self._get_snowpilot(snowpilot_table)
                 longitude = snowpilot.longitude
                 latitude = snowpilot.latitude
                 logger.debug(
                     f"Extracted coordinates from SnowPilot: ({longitude}, {latitude})"
                 )
                 return longitude, latitude
-            except Exception as e:
-                logger.exception(f"Error parsing Snow Pilot XML: {e}")
+            except ScraperError as e:
+                logger.warning(f"Error loading Snow Pilot XML: {e}")
                 return longitude, latitude
 
-    def get_region(self, web_access: BeautifulSoup) -> tuple[str, str]:
+    def _get_map_coordinates(
+        self, web_access: BeautifulSoup
+    ) -> tuple[float | None, float | None]:
         """
-        Extract parent region and subregion names.
+        Extract (longitude, latitude) from the embedded map script only.
 
         Args:
             web_access: BeautifulSoup object of the observation page.
 
+        Returns:
+            tuple: (longitude, latitude) or (None, None) if the map has no point.
+        """
+        script_tag = web_access.find("script", string=_BACKDROP_RE)
+        script = script_tag.string
+        # Directly search for the first POINT WKT after the geofield settings
+        start = script.find(_GEOFIELD_KEY)
+        if start >= 0:
+            start = script.find(_WKT_POINT, start)
+        if start >= 0:
+            start += len(_WKT_POINT)
+            try:
+                longitude, latitude = script[start : script.index(")", start)].split()
+                return float(longitude), float(latitude)
+            except ValueError:
+                pass
+        # Differently spaced or ordered settings still match the full pattern
+        match = _WKT_RE.search(script)
+        if match:
+            return float(match.group(1)), float(match.group(2))
+        return None, None
+
+    def get_region(self, fields: dict[str, str | None]) -> tuple[str, str]:
+        """
+        Extract parent region and subregion names.
+
+        Args:
+            fields: Field map of the observation page.
+
         Returns:
             tuple: (parent_region, subregion) strings.
         """
-        region = self.get_field_value(web_access, "Region")
+        region = fields.get("Region")
         parts = [p.strip() for p in region.split("»")]
         parent, subregion = parts[0], parts[-1]
         logger.debug(f"Extracted region: {parent} » {subregion}")
         return parent, subregion
 
     def get_snow_profile(
-        self, web_access: BeautifulSoup
+        self,
+        snow_profile: tuple[str | None, str | None, str | None],
+        fields: dict[str, str | None],
     ) -> tuple[str | None, str | None, str | None]:
         """
-        Extract snow profile information (aspect, elevation, slope angle).
+        Resolve snow profile information (aspect, elevation, slope angle).
 
-        First attempts to extract from the observation page, then falls back to
-        SnowPilot profile if available.
+        Uses the values from the observation page, then falls back to
+        SnowPilot profile for any that are missing.
 
         Args:
-            web_access: BeautifulSoup object of the observation page.
+            snow_profile: Page values from ``_get_page_snow_profile``.
+            fields: Field map of the observation page.
 
         Returns:
             tuple: (aspect, elevation, slope_angle) or (None, None, None) if unavailable.
         """
-        aspect, elevation, slope_angle = None, None, None
-        # try to get the information for snow profile from UTAC
-        aspect = self.get_field_value(web_access, "Aspect")
-        elevation = self.get_field_value(web_access, "Elevation")
-        slope_angle = self.get_field_value(web_access, "Slope Angle")
-        if slope_angle is not None:
-            if slope_angle.lower() == "unknown":
-                slope_angle = None
-            else:
-                slope_angle = "".join(re.findall(r"[\d\.]+", slope_angle))
+        # the information for snow profile from UTAC
+        aspect, elevation, slope_angle = snow_profile
 
         # is there any of the values missing
         if aspect is not None and elevation is not None and slope_angle is not None:
@@ -187,23 +307,98 @@ class UtahScraper(BaseScraper):
 
         # is there a snow profile table?
         logger.debug("Some snow profile data missing, checking SnowPilot")
-        snowpilot_table = self.get_field_value(web_access, "Snow Pilot URL")
+        snowpilot_table = fields.get("Snow Pilot URL")
         if snowpilot_table is None:
             logger.debug("No SnowPilot URL available for snow profile data")
             return aspect, elevation, slope_angle
         try:
-            snowpilot = SnowPilotClient(snowpilot_table)
+            snowpilot = self._get_snowpilot(snowpilot_table)
             aspect = aspect or snowpilot.aspect
             slope_angle = slope_angle or snowpilot.slope_angle
             elevation = elevation or snowpilot.elevation
             logger.debug(
                 f"Merged snow profile with SnowPilot: aspect={aspect}, elevation={elevation}, angle={slope_angle}"
             )
-        except Exception as e:
-            logger.exception("Error parsing Snow Pilot XML: %s", e)
+        except ScraperError as e:
+            logger.warning("Error loading Snow Pilot XML: %s", e)
             return None, None, None
         return aspect, elevation, slope_angle
 
+    def _get_page_snow_profile(
+        self, fields: dict[str, str | None]
+    ) -> tuple[str | None, str | None, str | None]:
+        """
+        Extract (aspect, elevation, slope_angle) from the observation page only.
+
+        Args:
+            fields: Field map of the observation page.
+
+        Returns:
+            tuple: (aspect, elevation, slope_angle), with None for missing fields.
+        """
+        aspect = fields.get("Aspect")
+        elevation = fields.get("Elevation")
+        slope_angle = fields.get("Slope Angle")
+        if slope_angle is not None:
+            if slope_angle.lower() == "unknown":
+                slope_angle = None
+            else:
+                slope_angle = "".join(_NUM_RE.findall(slope_angle))
+        return aspect, elevation, slope_angle
+
+    def _get_snowpilot(self, url: str) -> SnowPilotClient:
+        """
+        Return the SnowPilot profile for a URL, loading it at most once.
+
+        Profiles loaded here are remembered alongside the prefetched ones, and
+        so are failures, so the coordinate and snow profile fallbacks of one
+        observation never fetch the same profile twice.
+
+        Args:
+            url: SnowPilot page URL from the observation.
+
+        Returns:
+            SnowPilotClient: The loaded profile.
+
+        Raises:
+            ScraperError: If the profile could not be loaded.
+        """
+        if url not in self._snowpilot_profiles:
+            try:
+                self._snowpilot_profiles[url] = SnowPilotClient(url, self._session)
+            except ScraperError:
+                self._snowpilot_profiles[url] = None
+                raise
+        snowpilot = self._snowpilot_profiles[url]
+        if snowpilot is None:
+            raise SnowPilotError(url, "SnowPilot profile failed to load")
+        return snowpilot
+
+    def _prefetch_snowpilot(self, pages: list[tuple[dict, tuple, tuple]]) -> None:
+        """
+        Concurrently load the SnowPilot profiles that the given pages will need.
+
+        A profile is only fetched when its page is missing coordinates or snow
+        profile fields, mirroring the fallbacks in ``get_lat_lon`` and
+        ``get_snow_profile``.
+
+        Args:
+            pages: (field map, map coordinates, page snow profile) of each
+                report page.
+        """
+        urls = []
+        for fields, coordinates, snow_profile in pages:
+            url = fields.get("Snow Pilot URL")
+            if url is None or url in self._snowpilot_profiles:
+                continue
+            if None in coordinates or None in snow_profile:
+                urls.append(url)
+        if urls:
+            logger.info(f"Prefetching {len(urls)} SnowPilot profiles")
+            self._snowpilot_profiles.update(
+                SnowPilotClient.fetch_many(urls, self._session)
+            )
+
     def get_avalanche_problem(
         self, index: int, web_access: BeautifulSoup
     ) -> tuple[str | None, str | None]:
@@ -243,8 +438,13 @@ class UtahScraper(BaseScraper):
             list[str] | None: List of red flag warnings, or None if not found.
         """
         # Find the label div exactly
-        label_div = web_access.find(
-            "div", string=lambda t: t and t.strip() == "Red Flags"
+        label_div = next(
+            (
+                div
+                for div in web_access.select(_RED_FLAGS_SELECTOR)
+                if div.get_text(strip=True) == "Red Flags"
+            ),
+            None,
         )
         if not label_div:
             return None
@@ -259,46 +459,62 @@ class UtahScraper(BaseScraper):
                 values.append(sib.get_text(strip=True))
         return values
 
-    def _get_base_info(self, web_url: str, web_access: BeautifulSoup) -> dict[str, Any]:
+    def _get_base_info(
+        self,
+        web_url: str,
+        fields: dict[str, str | None],
+        coordinates: tuple[float | None, float | None],
+        snow_profile: tuple[str | None, str | None, str | None],
+    ) -> dict[str, Any]:
         """
         Extract base information common to all report types.
 
         Args:
             web_url: URL of the observation/avalanche page.
-            web_access: BeautifulSoup object of the page.
+            fields: Field map of the page.
+            coordinates: Map coordinates of the page.
+            snow_profile: Snow profile values read from the page.
 
         Returns:
             dict: Base information dictionary including location, region, and geography.
         """
-        longitude, latitude = self.get_lat_lon(web_access)
-        parent_region, subregion = self.get_region(web_access)
-        aspect, elevation, slope_angle = self.get_snow_profile(web_access)
+        longitude, latitude = self.get_lat_lon(coordinates, fields)
+        parent_region, subregion = self.get_region(fields)
+        aspect, elevation, slope_angle = self.get_snow_profile(snow_profile, fields)
+        # UTAC gives text like "10,200'"; SnowPilot values are already numeric
+        if isinstance(elevation, str):
+            elevation = (
+                clean_numeric(elevation.replace(",", ""))
+                if elevation.lower() != "unknown"
+                else None
+            )
         base_info = {
-            "report_id": web_url.split("/")[-1],
+            "report_id": web_url.rsplit("/", 1)[-1],
             "state_id": 45,
             "state_name": "Utah",
             "report_url": web_url,
             "observation_date": f"{self.year}-{self.month}-{self.day}",
-            "location_name": web_access.find(
-                "div", class_="field-label", string="Location Name or Route"
-            )
-            .find_next_sibling("div")
-            .get_text(strip=True),
+            "location_name": fields.get("Location Name or Route"),
             "region_id": lookup.get(parent_region),
             "region_name": parent_region,
-            "sub-region_name": subregion,
+            "sub_region_name": subregion,
             "latitude": latitude,
             "longitude": longitude,
-            "elevation_ft": int(re.sub(r"[\[\],'`\"]", "", elevation.replace(",", "")))
-            if elevation is not None and elevation.lower() != "unknown"
-            else None,
+            "elevation_ft": round(elevation) if elevation is not None else None,
             "aspect": aspect,
-            "slope_angle": int(slope_angle) if slope_angle is not None else None,
+            "slope_angle": round(float(slope_angle))
+            if slope_angle is not None
+            else None,
         }
         return base_info
 
     def _normalize_avalanche(
-        self, web_url: str, web_access: BeautifulSoup
+        self,
+        web_url: str,
+        web_access: BeautifulSoup,
+        fields: dict[str, str | None],
+        coordinates: tuple[float | None, float | None],
+        snow_profile: tuple[str | None, str | None, str | None],
     ) -> tuple[dict[str, Any], dict[str, Any]]:
         """
         Parse and normalize avalanche incident data.
@@ -306,29 +522,28 @@ class UtahScraper(BaseScraper):
         Args:
             web_url: URL of the avalanche report page.
             web_access: BeautifulSoup object of the page.
+            fields: Field map of the page.
+            coordinates: Map coordinates of the page.
+            snow_profile: Snow profile values read from the page.
 
         Returns:
             tuple: (base_info dict, avalanche_information dict)
         """
         logger.debug(f"Normalizing avalanche report: {web_url}")
 
-        base_info = self._get_base_info(web_url, web_access)
-        depth_raw = self.get_field_value(web_access, "Depth")
-        width_raw = self.get_field_value(web_access, "Width")
-        vertical_raw = self.get_field_value(web_access, "Vertical")
+        base_info = self._get_base_info(web_url, fields, coordinates, snow_profile)
+        depth_raw = fields.get("Depth")
+        width_raw = fields.get("Width")
+        vertical_raw = fields.get("Vertical")
 
         avalanche_information = {
-            "report_id": web_url.split("/")[-1],
-            "avalanche_date": datetime.strptime(
-                self.get_field_value(web_access, "Avalanche Date"), "%A, %B %d, %Y"
-            ).strftime("%Y-%m-%d"),
-            "trigger": self.get_field_value(web_access, "Trigger"),
-            "trigger_additional": self.get_field_value(
-                web_access, "Trigger: additional info"
-            ),
-            "avalanche_type": self.get_field_value(web_access, "Avalanche Type"),
-            "problem": self.get_field_value(web_access, "Avalanche Problem"),
-            "weak_layer": self.get_field_value(web_access, "Weak Layer"),
+            "report_id": base_info["report_id"],
+            "avalanche_date": parse_long_date(fields.get("Avalanche Date")),
+            "trigger": fields.get("Trigger"),
+            "trigger_additional": fields.get("Trigger: additional info"),
+            "avalanche_type": fields.get("Avalanche Type"),
+            "problem": fields.get("Avalanche Problem"),
+            "weak_layer": fields.get("Weak Layer"),
             "depth": int(convert_to_inches(depth_raw))
             if depth_raw is not None and depth_raw.lower() != "unknown"
             else None,
@@ -338,13 +553,18 @@ class UtahScraper(BaseScraper):
             "vertical_feet": clean_numeric(vertical_raw)
             if vertical_raw is not None and vertical_raw.lower() != "unknown"
             else None,
-            "caught": self.get_field_value(web_access, "Caught"),
-            "carried": self.get_field_value(web_access, "Carried"),
+            "caught": fields.get("Caught"),
+            "carried": fields.get("Carried"),
         }
         return base_info, avalanche_information
 
     def _normalize_observation(
-        self, web_url: str, web_access: BeautifulSoup
+        self,
+        web_url: str,
+        web_access: BeautifulSoup,
+        fields: dict[str, str | None],
+        coordinates: tuple[float | None, float | None],
+        snow_profile: tuple[str | None, str | None, str | None],
     ) -> tuple[dict[str, Any], dict[str, Any]]:
         """
         Parse and normalize observation data.
@@ -352,32 +572,29 @@ class UtahScraper(BaseScraper):
         Args:
             web_url: URL of the observation page.
             web_access: BeautifulSoup object of the page.
+            fields: Field map of the page.
+            coordinates: Map coordinates of the page.
+            snow_profile: Snow profile values read from the page.
 
         Returns:
             tuple: (base_info dict, snow_observations dict)
         """
         logger.debug(f"Normalizing observation: {web_url}")
-        base_info = self._get_base_info(web_url, web_access)
+        base_info = self._get_base_info(web_url, fields, coordinates, snow_profile)
         problem1, trend1 = self.get_avalanche_problem(index=1, web_access=web_access)
         problem2, trend2 = self.get_avalanche_problem(index=2, web_access=web_access)
         snow_observations = {
             "red_flags": self.get_red_flags(web_access),
-            "new_snow_depth": self.get_field_value(web_access, "New Snow Depth"),
-            "new_snow_density": self.get_field_value(web_access, "New Snow Density"),
-            "snow_surface_conditions": self.get_field_value(
-                web_access, "Snow Surface Conditions"
-            ),
+            "new_snow_depth": fields.get("New Snow Depth"),
+            "new_snow_density": fields.get("New Snow Density"),
+            "snow_surface_conditions": fields.get("Snow Surface Conditions"),
             "avy_problem_1": problem1,
             "avy_problem_1_trend": trend1,
             "avy_problem_2": problem2,
             "avy_problem_2_trend": trend2,
-            "today_rating": self.get_field_value(
-                web_access, "Today's Observed Danger Rating"
-            ),
-            "tomorrow_rating": self.get_field_value(
-                web_access, "Tomorrows Estimated Danger Rating"
-            ),
-            "report_id": web_url.split("/")[-1],
+            "today_rating": fields.get("Today's Observed Danger Rating"),
+            "tomorrow_rating": fields.get("Tomorrows Estimated Danger Rating"),
+            "report_id": base_info["report_id"],
         }
         return base_info, snow_observations
 
@@ -385,42 +602,150 @@ class UtahScraper(BaseScraper):
         """
         Fetch and parse all observation and avalanche reports for the specified date.
 
-        Retrieves all report links, then iterates through each one to extract
-        and normalize the data.
+        Retrieves all report links and fetches the report pages concurrently
+        under a shared rate limit, loads any SnowPilot profiles the pages need
+        concurrently, then extracts and normalizes the data. The normalized
+        reports are written to the database in a single batch once every page
+        has been processed. A page that cannot be fetched or parsed is skipped;
+        the other reports are still saved before its error is raised.
 
         Returns:
             list: List of tuples containing (base_info, specific_data) for each report.
 
         Raises:
             NetworkError: If a report page cannot be reached.
+            RateLimitError: If the site keeps rate limiting a report page.
+            StorageError: If the reports could not be saved.
             ValueError: If an unsupported report type is encountered.
+            Exception: The first error raised while parsing a report page.
         """
         logger.info(f"Fetching data for {self.year}-{self.month}-{self.day}")
         table_links = self.extract_report_links()
-
-        for link in table_links:
-            page_url = f"https://utahavalanchecenter.org{link}"
+        pages = [None] * len(table_links)
+        error = None
+
+        # Pages download concurrently; parsing stays on this thread
+        with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+            futures = {
+                executor.submit(self._fetch_page, f"{UAC_ROOT}{link}"): index
+                for index, link in enumerate(table_links)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    page_url, content = future.result()
+                    pages[index] = self._parse_page(
+                        table_links[index], page_url, content
+                    )
+                except Exception as e:
+                    # Keep going so the pages that did load are still saved
+                    logger.error(f"Skipping report {table_links[index]}: {e}")
+                    error = error or e
+
+        pages = [page for page in pages if page is not None]
+        self._prefetch_snowpilot([page[3:] for page in pages])
+
+        reports = []
+        for link, page_url, web_access, *page_data in pages:
+            logger.debug(f"Processing report: {page_url}")
+            first_word = link.split("/")[1]
+            normalize = self._normalizers.get(first_word)
             try:
-                logger.debug(f"Processing report: {page_url}")
-                time.sleep(1)  # Add delay between requests
-                web_access = BeautifulSoup(
-                    self.session.get(page_url, timeout=10).text, features="html.parser"
-                )
-                first_word = link.split("/")[1]
-                if first_word == "avalanche":
-                    data = self._normalize_avalanche(page_url, web_access)
-                    DatabaseManager().insert_report(data[0], data[1], "avalanche")
-                elif first_word == "observation":
-                    data = self._normalize_observation(page_url, web_access)
-                    print(f"Inserting observation report: {data[0]['report_id']}")
-                    DatabaseManager().insert_report(data[0], data[1], "observation")
-                else:
-                    logger.error(f"Unsupported report type: {first_word}")
+                if normalize is None:
                     raise ValueError(f"{first_word} data is not currently supported")
-            except requests.RequestException as e:
-                logger.error(f"Failed to fetch {page_url}: {e}")
-                raise NetworkError(page_url, "Could not reach report page")
-        return table_links
+                reports.append(normalize(page_url, web_access, *page_data))
+            except Exception as e:
+                # One malformed page must not cost the reports that did parse
+                logger.error(f"Failed to normalize {page_url}: {e}")
+                error = error or e
+
+        self._store_reports(reports)
+        if error is not None:
+            raise error
+        return reports
+
+    def _parse_page(self, link: str, page_url: str, content: bytes) -> tuple:
+        """
+        Parse a downloaded report page and read the values every step needs.
+
+        The map coordinates and page snow profile are read once here; both the
+        SnowPilot prefetch and normalization use them.
+
+        Args:
+            link: Relative report link from the search page.
+            page_url: Absolute URL of the report page.
+            content: Raw page HTML.
+
+        Returns:
+            tuple: (link, page_url, BeautifulSoup object, field map,
+            map coordinates, page snow profile).
+        """
+        web_access = BeautifulSoup(
+            content, features="lxml", parse_only=_REPORT_STRAINER
+        )
+        fields = self._build_field_map(web_access)
+        return (
+            link,
+            page_url,
+            web_access,
+            fields,
+            self._get_map_coordinates(web_access),
+            self._get_page_snow_profile(fields),
+        )
+
+    def _store_reports(self, reports: list[tuple[dict, dict]]) -> None:
+        """
+        Write normalized reports to the database in one batch.
+
+        Args:
+            reports: (base_info, specific_data) tuples to save.
+
+        Raises:
+            StorageError: If any of the reports were not saved.
+        """
+        if not reports:
+            return
+        stored = get_db().insert_reports_batch(reports)
+        if stored < len(reports):
+            raise StorageError(len(reports) - stored)
+
+    def _fetch_page(self, page_url: str) -> tuple[str, bytes]:
+        """
+        Download one report page, waiting for the rate limiter first.
+
+        The pool already retries 429 responses after their
+        Retry-After delay; seeing one also slows the limiter shared by all
+        page workers so the rest of the run stays under the server's limit,
+        and a run of unthrottled responses lets it speed back up.
+
+        Args:
+            page_url: Absolute URL of the report page.
+
+        Returns:
+            tuple: (page_url, raw page HTML).
+
+        Raises:
+            NetworkError: If the page cannot be reached.
+            RateLimitError: If the server is still rate limiting after retries.
+        """
+        self._rate_limiter.acquire()
+        try:
+            logger.debug(f"Fetching report: {page_url}")
+            response = self.pool.request("GET", page_url, timeout=10)
+        except urllib3.exceptions.HTTPError as e:
+            logger.error(f"Failed to fetch {page_url}: {e}")
+            raise NetworkError(page_url, "Could not reach report page")
+
+        if was_throttled(response):
+            self._rate_limiter.slow_down()
+        else:
+            self._rate_limiter.speed_up()
+        if response.status == 429:
+            raise RateLimitError(retry_after(response))
+        if response.status >= 400:
+            logger.error(f"Failed to fetch {page_url}: HTTP {response.status}")
+            raise NetworkError(page_url, "Could not reach report page")
+        return page_url, response.data
 
     def extract_report_links(self) -> list[str]:
         """
@@ -434,13 +759,14 @@ class UtahScraper(BaseScraper):
         """
         try:
             logger.debug(f"Extracting report links from: {self.url}")
-            response = self.session.get(self.url, timeout=10)
-            main_page = BeautifulSoup(response.text, "html.parser")
-            get_table = main_page.find("div", class_="view-content")
-
-            table = get_table.find("table")
-
-            links = [link.get("href") for link in table.find_all("a")]
+            response = self.pool.request("GET", self.url, timeout=10)
+            # Only the hrefs are needed, so query lxml directly instead of
+            # building a BeautifulSoup tree
+            table = lxml.html.fromstring(response.data).xpath(_RESULTS_TABLE_XPATH)
+            if not table:
+                raise ValueError("results table not found")
+
+            links = [str(href) for href in table[0].xpath(".//a/@href")]
             logger.debug(f"Found {len(links)} report links")
             return links
 
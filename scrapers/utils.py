@@ -1,6 +1,32 @@
-from datetime import date, timedelta
+import functools
+from datetime import date, datetime, timedelta
 import re
 
+# Feet and optional inches, e.g. 2'6" or 3'
+_LEN_RE = re.compile(r"(?P<feet>\d+)\'\s*(?P<inches>\d+(?:\.\d+)?)?\"?")
+
+# English month and weekday names as they appear in long-form dates
+_MONTHS = {
+    "January": 1,
+    "February": 2,
+    "March": 3,
+    "April": 4,
+    "May": 5,
+    "June": 6,
+    "July": 7,
+    "August": 8,
+    "September": 9,
+    "October": 10,
+    "November": 11,
+    "December": 12,
+}
+_WEEKDAYS = frozenset(
+    ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+)
+
+# Deletes bracket, comma and quote characters left around scraped numbers
+_STRIP = str.maketrans("", "", "[],'`\"")
+
 
 def get_yesterday_date() -> tuple[str, str, str]:
     """Get yesterday's date formatted for scraping.
@@ -18,25 +44,36 @@ def get_yesterday_date() -> tuple[str, str, str]:
         >>> get_yesterday_date()
         ('09', '01', '2026')  # If today is January 10, 2026
     """
-    yesterday = date.today() - timedelta(days=1)
-    day = yesterday.strftime("%d")
-    month = yesterday.strftime("%m")
-    year = yesterday.strftime("%Y")
-    return (day, month, year)
+    return _day_before(date.today())
 
 
-def convert_to_inches(length_str):
-    # Regex to find numbers followed by ' or "
-    # Matches: (optional feet)(') (optional space) (optional inches)(")
-    pattern = r"(?P<feet>\d+)\'\s*(?P<inches>\d+(?:\.\d+)?)?\"?"
-    match = re.search(pattern, length_str)
+@functools.lru_cache(maxsize=1)
+def _day_before(today: date) -> tuple[str, str, str]:
+    """Format the day before ``today``; cached so repeat calls on a day are free."""
+    yesterday = today - timedelta(days=1)
+    return (f"{yesterday.day:02d}", f"{yesterday.month:02d}", f"{yesterday.year:04d}")
 
-    if not match:
+
+def convert_to_inches(length_str):
+    feet, sep, inches = length_str.partition("'")
+    if not sep:
         # Fallback for inches-only strings (e.g., "12\"")
         if '"' in length_str:
             return float(length_str.replace('"', ""))
         return 0.0
 
+    # Plain feet'inches" values split directly; anything else goes to the regex
+    inches = inches.strip().rstrip('"')
+    try:
+        return int(int(feet) * 12 + (float(inches) if inches else 0.0))
+    except ValueError:
+        pass
+
+    # Matches: (optional feet)(') (optional space) (optional inches)(")
+    match = _LEN_RE.search(length_str)
+    if not match:
+        return 0.0
+
     feet = int(match.group("feet")) if match.group("feet") else 0
     inches = float(match.group("inches")) if match.group("inches") else 0.0
 
@@ -46,5 +83,36 @@ def convert_to_inches(length_str):
 def clean_numeric(value: str | None) -> int | None:
     if value is None:
         return None
-    cleaned = re.sub(r"[\[\],'`\"]", "", value)
+    cleaned = value.translate(_STRIP)
     return int(cleaned) if cleaned else None
+
+
+def parse_long_date(value: str) -> str:
+    """Convert a long-form date such as "Friday, January 9, 2026" to ISO format.
+
+    Splits the fixed English layout directly and lets ``date`` validate the
+    day; text of any other shape falls back to ``strptime``.
+
+    Args:
+        value: Date text in the form "<Weekday>, <Month> <day>, <year>".
+
+    Returns:
+        str: The date as "YYYY-MM-DD".
+
+    Raises:
+        ValueError: If the text is not a long-form date.
+    """
+    try:
+        weekday, month, day, year = value.split()
+        if (
+            weekday.endswith(",")
+            and weekday[:-1] in _WEEKDAYS
+            and day.endswith(",")
+            and day[:-1].isdigit()
+            and len(year) == 4
+            and year.isdigit()
+        ):
+            return date(int(year), _MONTHS[month], int(day[:-1])).isoformat()
+    except (KeyError, ValueError):
+        pass
+    return datetime.strptime(value, "%A, %B %d, %Y").strftime("%Y-%m-%d")
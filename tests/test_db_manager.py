@@ -0,0 +1,47 @@
+import psycopg
+import pytest
+
+from database.db_manager import DatabaseManager
+
+
+def report(report_id: str) -> tuple[dict, dict]:
+    base_info = {
+        "report_id": report_id,
+        "report_url": f"https://utahavalanchecenter.org/observation/{report_id}",
+    }
+    return base_info, {"report_id": report_id}
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """DatabaseManager whose inserts fail for any batch containing report "bad"."""
+    manager = DatabaseManager()
+    manager.stored = []
+
+    def insert_reports(reports):
+        if any(base_info["report_id"] == "bad" for base_info, _, _ in reports):
+            raise psycopg.errors.StringDataRightTruncation("value too long")
+        manager.stored.extend(base_info["report_id"] for base_info, _, _ in reports)
+
+    monkeypatch.setattr(manager, "_insert_reports", insert_reports)
+    return manager
+
+
+def test_bad_report_does_not_drop_the_rest_of_the_batch(manager):
+    inserted = manager.insert_reports_batch([report("1"), report("bad"), report("3")])
+
+    assert inserted == 2
+    assert manager.stored == ["1", "3"]
+
+
+def test_connection_failure_is_not_retried_per_report(manager, monkeypatch):
+    calls = []
+
+    def insert_reports(reports):
+        calls.append(reports)
+        raise psycopg.OperationalError("connection refused")
+
+    monkeypatch.setattr(manager, "_insert_reports", insert_reports)
+
+    assert manager.insert_reports_batch([report("1"), report("2")]) == 0
+    assert len(calls) == 1
@@ -0,0 +1,35 @@
+from scrapers.scraper_base import RECOVERY_AFTER, RateLimiter
+
+
+def test_rate_limiter_recovers_after_unthrottled_requests():
+    limiter = RateLimiter(8)
+    limiter.slow_down()
+    limiter.slow_down()
+    assert limiter.rate == 2
+
+    for _ in range(RECOVERY_AFTER - 1):
+        limiter.speed_up()
+    assert limiter.rate == 2
+    limiter.speed_up()
+    assert limiter.rate == 4
+
+    for _ in range(RECOVERY_AFTER * 3):
+        limiter.speed_up()
+    assert limiter.rate == 8
+
+
+def test_rate_limiter_slow_down_resets_recovery():
+    limiter = RateLimiter(8)
+    limiter.slow_down()
+    for _ in range(RECOVERY_AFTER - 1):
+        limiter.speed_up()
+    limiter.slow_down()
+    limiter.speed_up()
+    assert limiter.rate == 2
+
+
+def test_rate_limiter_slow_down_stops_at_floor():
+    limiter = RateLimiter(16)
+    for _ in range(10):
+        limiter.slow_down()
+    assert limiter.rate == limiter.min_rate == 1
@@ -0,0 +1,36 @@
+import pytest
+
+from scrapers.snowpilot import SnowPilotClient
+
+
+@pytest.fixture
+def client():
+    # Skip __init__, which downloads the profile
+    return SnowPilotClient.__new__(SnowPilotClient)
+
+
+@pytest.mark.parametrize(
+    ("degrees", "expected"),
+    [
+        ("0", "N"),
+        ("45", "NE"),
+        ("225°", "SW"),
+        (359, "N"),
+        # Half-way headings keep the original round-half-to-even behaviour
+        ("22.5", "N"),
+        ("67.5", "E"),
+        ("337.5", "N"),
+    ],
+)
+def test_degrees_to_compass(client, degrees, expected):
+    assert client._degrees_to_compass(degrees) == expected
+
+
+@pytest.mark.parametrize("degrees", [None, "", "unknown", "nan", "inf", "-inf"])
+def test_degrees_to_compass_rejects_invalid_values(client, degrees):
+    assert client._degrees_to_compass(degrees) is None
+
+
+def test_find_xml_href_tolerates_undecodable_bytes(client):
+    content = b'<a href="/snowpilot-xml/9?name=\xff&amp;x=1">Download XML</a>'
+    assert client._find_xml_href(content) == "/snowpilot-xml/9?name=\ufffd&x=1"
@@ -0,0 +1,79 @@
+import pytest
+import urllib3
+
+from scrapers import utah_scraper
+from scrapers.utah_scraper import UtahScraper
+
+SEARCH_PAGE = b"""<html><body><div class="view-content"><table>
+<tr><td><a href="/observation/1">one</a></td></tr>
+<tr><td><a href="/observation/2">two</a></td></tr>
+<tr><td><a href="/observation/3">three</a></td></tr>
+</table></div></body></html>"""
+
+MAP_SCRIPT = (
+    "<script>window.Backdrop = {"
+    '"geofield_formatter":{"x":{"wkt":"POINT (-111.65 40.58)"}}};</script>'
+)
+
+
+def field(label: str, value: str) -> str:
+    return (
+        f'<div><div class="field-label">{label}</div>'
+        f'<div class="text_02 mb2">{value}</div></div>'
+    )
+
+
+def observation_page(region: str | None) -> bytes:
+    region_field = field("Region", region) if region else ""
+    return (
+        f"<html><head>{MAP_SCRIPT}</head><body>"
+        f"{field('Location Name or Route', 'Cardiff Peak')}{region_field}"
+        f"{field('Aspect', 'North')}{field('Elevation', '10,200')}"
+        f"{field('Slope Angle', '35')}</body></html>"
+    ).encode()
+
+
+class FakeResponse:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.status = 200
+        self.headers = {}
+        self.retries = None
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.stored = []
+
+    def insert_reports_batch(self, reports):
+        self.stored.extend(reports)
+        return len(reports)
+
+
+@pytest.fixture
+def database(monkeypatch):
+    pages = {
+        f"{utah_scraper.UAC_ROOT}/observation/1": observation_page("Salt Lake » Mill"),
+        # No Region label: normalizing this page fails
+        f"{utah_scraper.UAC_ROOT}/observation/2": observation_page(None),
+        f"{utah_scraper.UAC_ROOT}/observation/3": observation_page("Provo"),
+    }
+
+    def request(self, method, url, **kwargs):
+        if method == "HEAD":
+            return FakeResponse(b"")
+        return FakeResponse(SEARCH_PAGE if "observations?" in url else pages[url])
+
+    monkeypatch.setattr(urllib3.PoolManager, "request", request)
+    database = FakeDatabase()
+    monkeypatch.setattr(utah_scraper, "get_db", lambda: database)
+    return database
+
+
+def test_malformed_page_does_not_drop_other_reports(database):
+    scraper = UtahScraper(("09", "01", "2026"), requests_per_second=1000)
+
+    with pytest.raises(AttributeError):
+        scraper.get_data()
+
+    assert sorted(base["report_id"] for base, _ in database.stored) == ["1", "3"]
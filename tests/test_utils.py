@@ -0,0 +1,31 @@
+import pytest
+
+from scrapers.utils import parse_long_date
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Friday, January 9, 2026", "2026-01-09"),
+        ("Friday, January 09, 2026", "2026-01-09"),
+        ("Wednesday, December 31, 2025", "2025-12-31"),
+    ],
+)
+def test_parse_long_date(value, expected):
+    assert parse_long_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Friday, January 9, 26",
+        "Friday January 9 2026",
+        "Friday, January 9 2026",
+        "Friday, January 32, 2026",
+        "Friday, Janvier 9, 2026",
+        "2026-01-09",
+    ],
+)
+def test_parse_long_date_rejects_other_layouts(value):
+    with pytest.raises(ValueError):
+        parse_long_date(value)